@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""
+Startup-time profile for the webhook receiver
+
+Imports ``src.main`` in a fresh interpreter with ``python -X importtime``,
+prints the slowest imports and then measures, in-process, the time until the
+app is ready (import plus building the shared services behind ``/ready``).
+The time until ready is compared with an aspirational target (300 ms) that
+the tree does not meet yet - importing ``fastapi`` alone takes most of it - so
+by default the target is only reported. Pass ``--budget-ms`` to turn it into a
+gate that exits with a non-zero status when exceeded.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+APP_MODULE = "src.main"
+# Aspirational, not gated by default; see the module docstring
+TARGET_MS = 300.0
+
+
+def profile_imports(module: str) -> list[tuple[int, int, str]]:
+    """
+    Run ``python -X importtime`` for a module and parse its report
+
+    Args:
+        module: Dotted module path to import
+
+    Returns:
+        List of (self_us, cumulative_us, module_name) tuples
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        entries.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return entries
+
+
+def measure_time_to_ready() -> float:
+    """
+    Measure the time to import the app and build its services, in ms
+
+    Runs in a fresh interpreter so already-imported modules do not skew it.
+    """
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"import {APP_MODULE}\n"
+        "from src.dependencies import get_mail_notification_service\n"
+        "get_mail_notification_service()\n"
+        "print((time.perf_counter() - start) * 1000)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--top", type=int, default=15, help="Number of slowest imports to show"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Fail when time until ready exceeds this many milliseconds",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    entries = profile_imports(APP_MODULE)
+    # Top-level imports are the ones without indentation in the report
+    top_level = [entry for entry in entries if not entry[2].startswith("  ")]
+    total_import_ms = sum(cumulative for _, cumulative, _ in top_level) / 1000
+
+    print(f"Slowest imports for {APP_MODULE} (cumulative):")
+    for _, cumulative, name in sorted(entries, key=lambda e: e[1], reverse=True)[
+        : args.top
+    ]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name.strip()}")
+    print(f"Total import time: {total_import_ms:.1f} ms")
+
+    ready_ms = measure_time_to_ready()
+    print(f"Time until ready:  {ready_ms:.1f} ms (target {TARGET_MS:.0f} ms)")
+    print(f"Profile took {(time.perf_counter() - started):.1f} s")
+
+    if args.budget_ms is None:
+        if ready_ms > TARGET_MS:
+            print("⚠️  Above the startup target (not gated)")
+        return 0
+
+    if ready_ms > args.budget_ms:
+        print(f"❌ Startup budget of {args.budget_ms:.0f} ms exceeded")
+        return 1
+    print(f"✅ Startup within budget of {args.budget_ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
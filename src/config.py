@@ -2,11 +2,13 @@
 Configuration settings for the Microsoft Graph webhook receiver
 """
 
-from dotenv import load_dotenv
+from functools import lru_cache
+from pathlib import Path
+
 from pydantic_settings import BaseSettings
 
-# Load environment variables
-load_dotenv()
+# Resolve .env from the project root so it is found from any working directory
+ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
 
 
 class Settings(BaseSettings):
@@ -37,10 +39,12 @@ class Settings(BaseSettings):
     payment_notification_recipient: str | None = None
 
     class Config:
-        env_file = ".env"
+        env_file = ENV_FILE
         case_sensitive = False
         extra = "ignore"  # Ignore extra fields in .env file
 
 
-# Create global settings instance
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Return the shared settings instance, creating it on first call"""
+    return Settings()
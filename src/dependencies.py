@@ -0,0 +1,80 @@
+"""
+FastAPI dependency providers for shared services
+
+Services are built on first use rather than at import time and cached, so the
+whole application shares a single GraphService (and its HTTP connection pool).
+FastAPI runs these sync providers in its threadpool, so construction is guarded
+by a lock to stop concurrent first requests from each building their own.
+"""
+
+import threading
+from functools import lru_cache
+
+from src.services.graph_service import GraphService
+from src.services.mail_notification_service import MailNotificationService
+from src.services.payment_notification_service import PaymentNotificationService
+
+# Reentrant because the mail service provider resolves the other providers
+_services_lock = threading.RLock()
+
+
+@lru_cache
+def _build_graph_service() -> GraphService:
+    return GraphService()
+
+
+@lru_cache
+def _build_payment_notification_service() -> PaymentNotificationService:
+    return PaymentNotificationService(graph_service=get_graph_service())
+
+
+@lru_cache
+def _build_mail_notification_service() -> MailNotificationService:
+    return MailNotificationService(
+        graph_service=get_graph_service(),
+        payment_notification_service=get_payment_notification_service(),
+    )
+
+
+def get_graph_service() -> GraphService:
+    """Return the shared Graph API service"""
+    with _services_lock:
+        return _build_graph_service()
+
+
+def get_payment_notification_service() -> PaymentNotificationService:
+    """Return the shared payment notification service"""
+    with _services_lock:
+        return _build_payment_notification_service()
+
+
+def get_mail_notification_service() -> MailNotificationService:
+    """Return the shared mail notification service"""
+    with _services_lock:
+        return _build_mail_notification_service()
+
+
+def services_built() -> bool:
+    """Return True once any shared service has been created"""
+    return any(
+        builder.cache_info().currsize
+        for builder in (
+            _build_graph_service,
+            _build_payment_notification_service,
+            _build_mail_notification_service,
+        )
+    )
+
+
+def reset_services() -> None:
+    """Forget the shared services so the next request builds new ones"""
+    with _services_lock:
+        _build_graph_service.cache_clear()
+        _build_payment_notification_service.cache_clear()
+        _build_mail_notification_service.cache_clear()
+
+
+async def close_services() -> None:
+    """Release resources held by the shared services, if they were built"""
+    if _build_graph_service.cache_info().currsize:
+        await get_graph_service().aclose()
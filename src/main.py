@@ -4,11 +4,18 @@ Main application entry point
 
 import logging
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from src.config import settings
+from src.config import get_settings
+from src.dependencies import close_services, get_mail_notification_service
 from src.routers import notifications
+from src.services.mail_notification_service import MailNotificationService
+
+# The app below is configured from settings, so they are read at import time;
+# only the notification services are built lazily (see src/dependencies.py)
+settings = get_settings()
 
 # Configure logging
 logging.basicConfig(
@@ -37,14 +44,50 @@ app.add_middleware(
 
 # Include routers
 app.include_router(notifications.router, prefix=settings.api_prefix)
+
+
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
+    """Liveness endpoint - answers as soon as the process is up"""
     return {
         "status": "healthy",
         "service": "Microsoft Graph Webhook Receiver",
     }
 
+
+@app.get("/ready")
+async def readiness_check(
+    mail_notification_service: MailNotificationService = Depends(
+        get_mail_notification_service
+    ),
+):
+    """Readiness endpoint - 503 until Microsoft Graph access is configured"""
+    graph_service = mail_notification_service.graph_service
+    missing = [
+        name
+        for name, value in (
+            ("graph_api_url", graph_service.graph_api_url),
+            ("access_token", graph_service.access_token),
+        )
+        if not value
+    ]
+
+    if missing:
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "not ready",
+                "service": "Microsoft Graph Webhook Receiver",
+                "missing": missing,
+            },
+        )
+
+    return {
+        "status": "ready",
+        "service": "Microsoft Graph Webhook Receiver",
+    }
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -71,6 +114,12 @@ async def startup_event():
         logger.info("To configure, set ACCESS_TOKEN in your .env file")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Application shutdown event"""
+    await close_services()
+
+
 def start():
     """Start the application using uvicorn"""
     import uvicorn
@@ -5,10 +5,12 @@ Router for handling Microsoft Graph webhook notifications
 import json
 import logging
 
-from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import PlainTextResponse
 
+from src.dependencies import get_graph_service, get_mail_notification_service
 from src.schemas.notifications import ChangeNotificationCollection
+from src.services.graph_service import GraphService
 from src.services.mail_notification_service import MailNotificationService
 
 logger = logging.getLogger(__name__)
@@ -19,12 +21,15 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-# Initialize mail notification service
-mail_notification_service = MailNotificationService()
-
 
 @router.post("")
-async def receive_notification(request: Request, validationToken: str | None = None):
+async def receive_notification(
+    request: Request,
+    validationToken: str | None = None,
+    mail_notification_service: MailNotificationService = Depends(
+        get_mail_notification_service
+    ),
+):
     """
     Endpoint to receive notifications from Microsoft Graph
 
@@ -64,10 +69,10 @@ async def receive_notification(request: Request, validationToken: str | None = N
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(graph_service: GraphService = Depends(get_graph_service)):
     """Health check endpoint"""
     return {
         "status": "healthy",
         "service": "Microsoft Graph Webhook Receiver",
-        "graph_configured": bool(mail_notification_service.graph_service.access_token),
+        "graph_configured": bool(graph_service.access_token),
     }
@@ -7,7 +7,7 @@ from typing import Any
 
 import httpx
 
-from src.config import settings
+from src.config import get_settings
 from src.schemas.notifications import MailDetails
 
 logger = logging.getLogger(__name__)
@@ -17,8 +17,23 @@ class GraphService:
     """Service to handle Microsoft Graph API operations"""
 
     def __init__(self):
+        settings = get_settings()
         self.graph_api_url = settings.graph_api_url
         self.access_token = settings.access_token
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client shared by all Graph calls, created on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=30.0)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and release its connection pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def send_mail(self, subject: str, message: str, recipient: str) -> bool:
         """Send an email using Microsoft Graph API
@@ -46,17 +61,16 @@ class GraphService:
                 "toRecipients": [{"emailAddress": {"address": recipient}}],
             }
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=data, timeout=30.0)
-            # 202 is accepted for async send mail operation
-            if response.status_code in [200, 202]:
-                logger.info("Email sent successfully")
-                return True
-            else:
-                logger.error(
-                    f"Failed to send mail: {response.status_code} - {response.text}"
-                )
-                return None
+        response = await self.client.post(url, headers=headers, json=data)
+        # 202 is accepted for async send mail operation
+        if response.status_code in [200, 202]:
+            logger.info("Email sent successfully")
+            return True
+        else:
+            logger.error(
+                f"Failed to send mail: {response.status_code} - {response.text}"
+            )
+            return None
 
     async def get_mail_details(
         self, user_id: str, message_id: str
@@ -82,18 +96,17 @@ class GraphService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, timeout=30.0)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return self._parse_mail_details(data)
-                else:
-                    logger.error(
-                        f"Failed to get mail details: "
-                        f"{response.status_code} - {response.text}"
-                    )
-                    return None
+            response = await self.client.get(url, headers=headers)
+
+            if response.status_code == 200:
+                data = response.json()
+                return self._parse_mail_details(data)
+            else:
+                logger.error(
+                    f"Failed to get mail details: "
+                    f"{response.status_code} - {response.text}"
+                )
+                return None
 
         except Exception as e:
             logger.error(f"Error fetching mail details: {e}")
@@ -14,9 +14,16 @@ logger = logging.getLogger(__name__)
 class MailNotificationService:
     """Service to handle mail notification processing"""
 
-    def __init__(self):
-        self.graph_service = GraphService()
-        self.payment_notification_service = PaymentNotificationService()
+    def __init__(
+        self,
+        graph_service: GraphService | None = None,
+        payment_notification_service: PaymentNotificationService | None = None,
+    ):
+        self.graph_service = graph_service or GraphService()
+        self.payment_notification_service = (
+            payment_notification_service
+            or PaymentNotificationService(graph_service=self.graph_service)
+        )
 
     async def process_mail_notification(self, notification: ChangeNotification):
         """Process individual mail notification"""
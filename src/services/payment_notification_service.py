@@ -5,7 +5,7 @@ Service for handling payment-related email notifications
 import logging
 import re
 
-from src.config import settings
+from src.config import get_settings
 from src.schemas.notifications import MailDetails
 from src.services.graph_service import GraphService
 
@@ -15,8 +15,8 @@ logger = logging.getLogger(__name__)
 class PaymentNotificationService:
     """Service to handle payment-related email notifications"""
 
-    def __init__(self):
-        self.graph_service = GraphService()
+    def __init__(self, graph_service: GraphService | None = None):
+        self.graph_service = graph_service or GraphService()
         # Payment-related keywords to check in subject
         self.payment_keywords = [
             r"\bpago\b",
@@ -36,7 +36,9 @@ class PaymentNotificationService:
             "|".join(self.payment_keywords), re.IGNORECASE
         )
         # Default recipient for payment notifications (configurable)
-        self.notification_recipient = settings.payment_notification_recipient or "admin@company.com"
+        self.notification_recipient = (
+            get_settings().payment_notification_recipient or "admin@company.com"
+        )
 
     def check_payment_subject(self, subject: str) -> bool:
         """
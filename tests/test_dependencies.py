@@ -0,0 +1,81 @@
+"""
+Tests for the lazily built, shared notification services
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src import dependencies
+from src.main import app
+from src.services.graph_service import GraphService
+
+
+@pytest.fixture(autouse=True)
+def clear_service_cache():
+    """Start and end every test without cached services"""
+    dependencies.reset_services()
+    yield
+    dependencies.reset_services()
+
+
+def test_services_are_not_built_until_first_request():
+    with TestClient(app) as client:
+        assert not dependencies.services_built()
+
+        response = client.post("/api/notifications?validationToken=abc")
+        assert response.status_code == 200
+        assert response.text == "abc"
+
+        client.post("/api/notifications", json={"value": []})
+        assert dependencies.services_built()
+
+
+def test_mail_and_payment_services_share_one_graph_service():
+    mail_service = dependencies.get_mail_notification_service()
+    graph_service = dependencies.get_graph_service()
+
+    assert mail_service.graph_service is graph_service
+    assert mail_service.payment_notification_service.graph_service is graph_service
+    assert (
+        mail_service.payment_notification_service
+        is dependencies.get_payment_notification_service()
+    )
+    assert graph_service.client is graph_service.client
+
+
+def test_concurrent_first_requests_build_one_graph_service(monkeypatch):
+    class SlowGraphService(GraphService):
+        """GraphService that widens the window for a construction race"""
+
+        def __init__(self):
+            time.sleep(0.05)
+            super().__init__()
+
+    monkeypatch.setattr(dependencies, "GraphService", SlowGraphService)
+    providers = [
+        dependencies.get_mail_notification_service,
+        dependencies.get_payment_notification_service,
+        dependencies.get_graph_service,
+    ] * 8
+
+    with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+        services = list(executor.map(lambda provider: provider(), providers))
+
+    graph_services = {
+        id(getattr(service, "graph_service", service)) for service in services
+    }
+    assert graph_services == {id(dependencies.get_graph_service())}
+
+
+def test_http_client_is_closed_after_lifespan_ends():
+    with TestClient(app) as client:
+        assert client.get("/api/notifications/health").status_code == 200
+        graph_service = dependencies.get_graph_service()
+        http_client = graph_service.client
+        assert not http_client.is_closed
+
+    assert http_client.is_closed
+    assert not graph_service.client.is_closed